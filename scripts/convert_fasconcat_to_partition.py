@@ -10,6 +10,7 @@ Based on tutorials by Paul Frandsen (BYU)
 """
 
 import sys
+from itertools import islice
 
 
 def convert_fcc_to_partition(fcc_file, output_file="partition_def.txt"):
@@ -22,17 +23,17 @@ def convert_fcc_to_partition(fcc_file, output_file="partition_def.txt"):
     """
 
     try:
-        with open(fcc_file, 'r') as f:
-            lines = f.readlines()
+        f = open(fcc_file, 'r')
     except FileNotFoundError:
         print(f"Error: File '{fcc_file}' not found")
         sys.exit(1)
 
     partitions_written = 0
 
-    with open(output_file, 'w') as out:
+    # Stream the info file line by line instead of loading it into memory
+    with f, open(output_file, 'w') as out:
         # Skip first two header lines (FASconCAT INFO and column headers)
-        for line in lines[2:]:
+        for line in islice(f, 2, None):
             line = line.strip()
             if line:
                 parts = line.split('\t')
@@ -11,6 +11,7 @@ OUTPUT_FILE="${1:-qc_report.csv}"
 echo "Genome,Complete_SCO,Fragmented,Duplicated,Missing,Completeness(%)" > "${OUTPUT_FILE}"
 
 count=0
+# Rows are written to stdout; the whole loop is appended to the report at once
 for dir in *_compleasm; do
   if [ ! -d "${dir}" ]; then
     continue
@@ -22,15 +23,16 @@ for dir in *_compleasm; do
   if [ -f "${summary}" ]; then
     # Parse completeness statistics from compleasm format
     # S: Single-copy complete, D: Duplicated, F: Fragmented, M: Missing
-    complete=$(grep "^S:" "${summary}" | awk -F', ' '{print $2}')
-    duplicated=$(grep "^D:" "${summary}" | awk -F', ' '{print $2}')
-    fragmented=$(grep "^F:" "${summary}" | awk -F', ' '{print $2}')
-    missing=$(grep "^M:" "${summary}" | awk -F', ' '{print $2}')
+    # Read all four counts in a single pass over the summary file
+    IFS=',' read -r complete duplicated fragmented missing < <(
+      awk -F', ' '/^S:/ {s=$2} /^D:/ {d=$2} /^F:/ {f=$2} /^M:/ {m=$2}
+                  END {print s "," d "," f "," m}' "${summary}"
+    )
 
     # Check if values were successfully extracted
     if [ -z "${complete}" ] || [ -z "${fragmented}" ] || [ -z "${missing}" ]; then
       echo "Warning: Could not parse summary file for ${genome}" >&2
-      echo "${genome},,,,,ERROR" >> "${OUTPUT_FILE}"
+      echo "${genome},,,,,ERROR"
       continue
     fi
 
@@ -46,12 +48,12 @@ for dir in *_compleasm; do
       completeness=$(awk "BEGIN {printf \"%.2f\", (${complete} + ${duplicated}) / ${total} * 100}")
     fi
 
-    echo "${genome},${complete},${fragmented},${duplicated},${missing},${completeness}" >> "${OUTPUT_FILE}"
+    echo "${genome},${complete},${fragmented},${duplicated},${missing},${completeness}"
     count=$((count + 1))
   else
     echo "Warning: Summary file not found for ${genome}" >&2
   fi
-done
+done >> "${OUTPUT_FILE}"
 
 if [ ${count} -eq 0 ]; then
   echo "Error: No compleasm output directories found (*_compleasm)" >&2